@@ -1,5 +1,6 @@
 from .main import (
     compile,
+    MultiRegex,
     ALL_OR_NONE,
     ANY,
     ANYTHING,
@@ -1,10 +1,49 @@
+import functools
+import itertools
+import mmap
+import os
 import re
+import sys
 
-from collections import abc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 
 class BaseAdder:
 
+    # NOTE: Nodes are treated as immutable once built, so renderings are
+    #       cached on first use. Only Regex changes (via +=) and it
+    #       clears its own caches when it does
+    __slots__ = ('_repr_cache',)
+    _repr_fields = ()
+    _ITERABLE = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The public slots, in declaration order, are the repr arguments
+        cls._repr_fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get('__slots__', ())
+            if not name.startswith('_')
+        )
+
     def __init__(self, *args, **kwargs):
         if any([args, kwargs]):
             cls = self.__class__.__name__
@@ -16,8 +55,18 @@ class BaseAdder:
         cls = self.__class__.__name__
         raise NotImplementedError(f'{cls} cannot be called')
 
+    def __str__(self):
+        return self._s
+
+    def _write(self, out):
+        # Appends this node's pattern fragments to out; Regex overrides
+        # it so a whole tree renders with a single join
+        out.append(self.__str__())
+
     def __repr__(self):
-        if isinstance(self, abc.Iterable):
+        if (cached := getattr(self, '_repr_cache', None)) is not None:
+            return cached
+        if self._ITERABLE:
             args = []
             for arg in self:
                 if isinstance(arg, str):
@@ -25,131 +74,357 @@ class BaseAdder:
                 else:
                     args.append(str(repr(arg)))
             args = f"[{', '.join(args)}]"
-        elif items := self.__dict__.items():
-            args = ', '.join((f'{k}=r"{v}"' for k, v in items))
+        elif names := self._repr_fields:
+            args = ', '.join((f'{k}=r"{getattr(self, k)}"' for k in names))
         else:
             args = ''
-        return rf'{self.__class__.__name__}({args})'
+        self._repr_cache = rf'{self.__class__.__name__}({args})'
+        return self._repr_cache
 
     def __add__(self, other):
-        if not issubclass(type(other), BaseAdder):
+        if not isinstance(other, BaseAdder):
             raise TypeError(f'Cannot concatenate Regex and {type(other)}')
+        # Splice Regex operands in flat so rendering stays a single join
+        others = other._parts if isinstance(other, Regex) else (other,)
         if isinstance(self, Regex):
-            return Regex(*self.parts, other)
-        return Regex(self, other)
+            return Regex(*self._parts, *others)
+        return Regex(self, *others)
 
     def __iadd__(self, other):
-        if not issubclass(type(other), BaseAdder):
+        if not isinstance(other, BaseAdder):
             raise TypeError(f'Cannot concatenate Regex and {type(other)}')
+        others = other._parts if isinstance(other, Regex) else (other,)
         if isinstance(self, Regex):
-            self.parts.append(other)
+            self._invalidate()
+            self._parts.extend(others)
             return self
-        return Regex(self, other)
+        return Regex(self, *others)
 
 
 def flagger():
 
     def flag_getter(instance):
-        return instance.__dict__['flags']
+        return instance._flags
 
     def flag_setter(instance, value):
-        prev_value = instance.__dict__.get('flags')
+        prev_value = getattr(instance, '_flags', None)
         if prev_value is None or value != prev_value:
             cls_name = instance.__class__.__name__
-            instance.__dict__[f'_{cls_name}__compiled'] = None
-            instance.__dict__['flags'] = value
+            setattr(instance, f'_{cls_name}__compiled', None)
+            instance._flags = value
 
     return property(flag_getter, flag_setter)
 
 
 class Regex(BaseAdder):
 
+    __slots__ = (
+        '_parts', '_flags', '__parts', '__compiled', '__literal', '__str',
+        '__hash',
+    )
+    _ITERABLE = True
+
     flags = flagger()
 
     # NOTE: Flags could be in the property closure with nonlocal
     #       instead of a class attr
     def __init__(self, *parts, flags=0):
-        self.parts = list(parts)
+        # A list so += extends it in place; parts hands out a tuple copy
+        self._parts = list(parts)
+        self.__parts = None
         self.flags = flags
         self.__compiled = None
+        self.__literal = ''
+        self.__str = None
+        self.__hash = None
+        self._repr_cache = None
+
+    @property
+    def parts(self):
+        if self.__parts is None:
+            self.__parts = tuple(self._parts)
+        return self.__parts
 
     def __repr__(self):
-        words = ', '.join((repr(p) for p in self.parts))
-        return rf'{self.__class__.__name__}({words})'
+        if self._repr_cache is None:
+            words = ', '.join(map(repr, self._parts))
+            self._repr_cache = rf'{self.__class__.__name__}({words})'
+        return self._repr_cache
 
     def __str__(self):
-        return r''.join((str(p) for p in self.parts))
+        if self.__str is None:
+            out = []
+            self._write(out)
+            self.__str = r''.join(out)
+        return self.__str
+
+    def _write(self, out):
+        if self.__str is not None:
+            out.append(self.__str)
+        else:
+            for part in self._parts:
+                _write_part(part, out)
+
+    def _invalidate(self):
+        # Called before the parts change so the cached renderings and
+        # the compiled pattern are rebuilt on next use
+        self.__parts = None
+        self.__compiled = None
+        self.__str = None
+        self.__hash = None
+        self._repr_cache = None
 
     def __getitem__(self, index):
-        return str(self)[index]
+        return self.__str__()[index]
 
     def __contains__(self, item):
-        return item in str(self)
+        return item in self.__str__()
 
     def __iter__(self):
-        yield from str(self)
+        # Walks the parts lazily unless the full pattern is already cached
+        if self.__str is not None:
+            return iter(self.__str)
+        return itertools.chain.from_iterable(map(str, self._parts))
 
     def __len__(self):
-        return len(str(self))
+        return len(self.__str__())
 
     def __eq__(self, other):
-        return isinstance(other, Regex) and str(self) == str(other)
+        if self is other:
+            return True
+        if not isinstance(other, Regex):
+            return False
+        a, b = self.__str__(), other.__str__()
+        return len(a) == len(b) and a == b
 
     def __hash__(self):
-        return hash(repr(self))
+        if self.__hash is None:
+            self.__hash = hash(self.__str__())
+        return self.__hash
 
     @property
     def compiled(self):
         if self.__compiled is None:
             try:
-                self.__compiled = re.compile(str(self), self.flags)
+                self.__compiled = _compile(str(self), self.flags)
+                self.__literal = _required_literal(str(self), self.flags)
             except re.error as e:
-                if m := re.search(r' position (\d+)', str(e)):
-                    print(
-                        f'Bad Regex char: {str(self)[int(m.group(1))]}'
-                    )
-                raise e
+                if e.pos is not None and e.pos < len(e.pattern):
+                    print(f'Bad Regex char: {e.pattern[e.pos]}')
+                raise
         return self.__compiled
 
-    def search(self, string, flags=0):
+    def search(self, string, flags=None):
         """See help(re.search) for help."""
-        self.flags = flags
-        return self.compiled.search(string)
-
-    def match(self, string, flags=0):
+        if flags is not None:
+            self.flags = flags
+        pattern = self.__compiled or self.compiled
+        if self.__literal and self.__literal not in string:
+            return None
+        return pattern.search(string)
+
+    def match(self, string, flags=None):
         """See help(re.match) for help."""
-        self.flags = flags
-        return self.compiled.match(string)
-
-    def fullmatch(self, string, flags=0):
+        if flags is not None:
+            self.flags = flags
+        pattern = self.__compiled or self.compiled
+        if self.__literal and self.__literal not in string:
+            return None
+        return pattern.match(string)
+
+    def fullmatch(self, string, flags=None):
         """See help(re.fullmatch) for help."""
-        self.flags = flags
-        return self.compiled.fullmatch(string)
-
-    def sub(self, repl, string, count=0, flags=0):
+        if flags is not None:
+            self.flags = flags
+        pattern = self.__compiled or self.compiled
+        if self.__literal and self.__literal not in string:
+            return None
+        return pattern.fullmatch(string)
+
+    def sub(self, repl, string, count=0, flags=None):
         """See help(re.sub) for help."""
-        self.flags = flags
-        return self.compiled.sub(repl, string, count)
+        if flags is not None:
+            self.flags = flags
+        return (self.__compiled or self.compiled).sub(repl, string, count)
 
-    def subn(self, repl, string, count=0, flags=0):
+    def subn(self, repl, string, count=0, flags=None):
         """See help(re.subn) for help."""
-        self.flags = flags
-        return self.compiled.subn(repl, string, count)
+        if flags is not None:
+            self.flags = flags
+        return (self.__compiled or self.compiled).subn(repl, string, count)
 
-    def split(self, string, maxsplit=0, flags=0):
+    def split(self, string, maxsplit=0, flags=None):
         """See help(re.split) for help."""
-        self.flags = flags
-        return self.compiled.split(string, maxsplit)
+        if flags is not None:
+            self.flags = flags
+        return (self.__compiled or self.compiled).split(string, maxsplit)
 
-    def findall(self, string, flags=0):
+    def findall(self, string, flags=None):
         """See help(re.findall) for help."""
-        self.flags = flags
-        return self.compiled.findall(string)
+        if flags is not None:
+            self.flags = flags
+        return (self.__compiled or self.compiled).findall(string)
 
-    def finditer(self, string, flags=0):
+    def finditer(self, string, flags=None):
         """See help(re.finditer) for help."""
-        self.flags = flags
-        return self.compiled.finditer(string)
+        if flags is not None:
+            self.flags = flags
+        return (self.__compiled or self.compiled).finditer(string)
+
+    def finditer_parallel(
+        self, string, workers=None, chunk=8 * 1024 * 1024, flags=None
+    ):
+        """Returns the same matches as finditer, scanning chunk-sized
+        pieces of string in a thread pool.
+
+        re holds the GIL while matching, so this only scans in parallel
+        on a free-threaded build of Python with the GIL disabled; anywhere
+        else, and for small strings, it is finditer.
+        """
+        if flags is not None:
+            self.flags = flags
+        pattern = self.__compiled or self.compiled
+        if (
+            getattr(sys, '_is_gil_enabled', lambda: True)()
+            or len(string) < 16 * 1024
+            or len(string) <= chunk
+        ):
+            return pattern.finditer(string)
+        return _finditer_parallel(pattern, string, workers, chunk)
+
+    def scan_file(self, path, lines=False):
+        """Yields the matches in the file at path, letting re scan a
+        read-only mmap of the whole file rather than reading it line by
+        line. The pattern is compiled for bytes, so the matches are too.
+
+        Bytes patterns are ASCII-only: \w, \d, \s, \b and IGNORECASE
+        only know ASCII characters, and any other character in the
+        pattern is matched as its UTF-8 bytes. For example, \w+ finds
+        b'Person' in 'Personæ'.
+
+        With lines=True, yields (line_number, match) pairs, counting
+        lines from 1.
+        """
+        # re.UNICODE is the default for str patterns and invalid for bytes
+        pattern = _compile(str(self).encode(), self.flags & ~re.UNICODE)
+        with open(path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return
+            # Left open for the matches to read from; it closes itself
+            # once the last of them is released
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if not lines:
+            yield from pattern.finditer(mm)
+            return
+        line_number, counted = 1, 0
+        for match in pattern.finditer(mm):
+            start = match.start()
+            line_number += mm[counted:start].count(b'\n')
+            counted = start
+            yield line_number, match
+
+
+class MultiRegex:
+    """Matches a fixed set of Regex objects against the same strings.
+
+    When the optional hyperscan package (or, failing that, google-re2)
+    is installed, every pattern it supports is compiled into a single
+    database, so each string is scanned once to find the patterns that
+    can match and only those are run through re. Patterns the prefilter
+    rejects (back references, lookbehinds, ...) are always run through
+    re. Flags are read from each Regex when the MultiRegex is created.
+    """
+
+    __slots__ = (
+        'regexes', '__prefilter', '__fallback', '__combined', '__separate'
+    )
+
+    def __init__(self, regexes):
+        self.regexes = tuple(
+            r if isinstance(r, Regex) else Regex(r) for r in regexes
+        )
+        self.__prefilter = None
+        self.__fallback = frozenset(range(len(self.regexes)))
+        self.__combined = None
+        self.__separate = None
+        if hyperscan is not None:
+            self.__prefilter, self.__fallback = _hyperscan_prefilter(
+                self.regexes
+            )
+        elif re2 is not None:
+            self.__prefilter, self.__fallback = _re2_prefilter(self.regexes)
+
+    def __repr__(self):
+        regexes = ', '.join(map(repr, self.regexes))
+        return rf'{self.__class__.__name__}([{regexes}])'
+
+    def search(self, string):
+        """Returns an {index: match} dict of every regex found in string,
+        keyed by the regex's position in regexes.
+
+        Regex equality ignores flags, so positions keep regexes that
+        differ only in their flags apart.
+        """
+        candidates = self.__fallback
+        if self.__prefilter is not None:
+            candidates = candidates.union(self.__prefilter(string))
+        results = {}
+        for i, regex in enumerate(self.regexes):
+            if i in candidates and (match := regex.compiled.search(string)):
+                results[i] = match
+        return results
+
+    def scan(self, lines):
+        """Yields (line, {index: match}) for every line in lines"""
+        for line in lines:
+            yield line, self.search(line)
+
+    @property
+    def combined(self):
+        """The regexes that can share one pattern, compiled into a single
+        alternation of named groups, or None if there are none.
+
+        A regex is left out, and run on its own, when nesting it would
+        change its meaning: it refers back to its own groups, it reuses
+        a group name already taken, or it sets global inline flags.
+        """
+        if self.__separate is None:
+            parts, separate = [], []
+            taken = {f'_r{i}' for i in range(len(self.regexes))}
+            for i, regex in enumerate(self.regexes):
+                names = regex.compiled.groupindex.keys()
+                part = _combinable(regex, rf'(?P<_r{i}>{_scoped(regex)})')
+                if part is None or not taken.isdisjoint(names):
+                    separate.append(i)
+                    continue
+                taken.update(names)
+                parts.append(part)
+            if parts:
+                self.__combined = _compile('|'.join(parts), 0)
+            self.__separate = tuple(separate)
+        return self.__combined
+
+    def counts(self, lines):
+        """Returns a Counter of index -> number of matches across lines,
+        keyed by each regex's position in regexes, as search is.
+
+        Each line is scanned once with the combined alternation, so the
+        counts of those regexes follow the rules of a single regex: at
+        every position the first regex in the list that matches wins and
+        matches do not overlap. Regexes left out of combined are counted
+        with their own finditer.
+        """
+        counter = Counter()
+        combined = self.combined
+        separate = [(i, self.regexes[i].compiled) for i in self.__separate]
+        for line in lines:
+            if combined is not None:
+                for match in combined.finditer(line):
+                    counter[int(match.lastgroup[2:])] += 1
+            for i, compiled in separate:
+                for match in compiled.finditer(line):
+                    counter[i] += 1
+        return counter
 
 
 class AnyAlphanumericWord(BaseAdder):
@@ -160,8 +435,8 @@ class AnyAlphanumericWord(BaseAdder):
                          by A.M. Kuchling <amk@amk.ca>
     """
 
-    def __str__(self):
-        return r'\w'
+    __slots__ = ()
+    _s = sys.intern(r'\w')
 
 
 class AnyNonAlphanumericWord(BaseAdder):
@@ -172,8 +447,8 @@ class AnyNonAlphanumericWord(BaseAdder):
                          by A.M. Kuchling <amk@amk.ca>
     """
 
-    def __str__(self):
-        return r'\W'
+    __slots__ = ()
+    _s = sys.intern(r'\W')
 
 
 class AnyDigit(BaseAdder):
@@ -183,8 +458,8 @@ class AnyDigit(BaseAdder):
                          by A.M. Kuchling <amk@amk.ca>
     """
 
-    def __str__(self):
-        return r'\d'
+    __slots__ = ()
+    _s = sys.intern(r'\d')
 
 
 class AnyNonDigit(BaseAdder):
@@ -194,8 +469,8 @@ class AnyNonDigit(BaseAdder):
                          by A.M. Kuchling <amk@amk.ca>
     """
 
-    def __str__(self):
-        return r'\D'
+    __slots__ = ()
+    _s = sys.intern(r'\D')
 
 
 class AnyWhitespaceCharacter(BaseAdder):
@@ -206,8 +481,8 @@ class AnyWhitespaceCharacter(BaseAdder):
                          by A.M. Kuchling <amk@amk.ca>
     """
 
-    def __str__(self):
-        return r'\s'
+    __slots__ = ()
+    _s = sys.intern(r'\s')
 
 
 class AnyNonWhitespaceCharacter(BaseAdder):
@@ -218,8 +493,8 @@ class AnyNonWhitespaceCharacter(BaseAdder):
                          by A.M. Kuchling <amk@amk.ca>
     """
 
-    def __str__(self):
-        return r'\S'
+    __slots__ = ()
+    _s = sys.intern(r'\S')
 
 
 class AnyWordGroup(BaseAdder):
@@ -228,19 +503,18 @@ class AnyWordGroup(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __init__(self, groups):
-        self.groups = list(groups)
+    __slots__ = ('groups', '_s')
+    _ITERABLE = True
 
-    @classmethod
-    def __call__(cls, groups):
-        return cls(groups)
+    def __init__(self, groups):
+        self.groups = tuple(groups)
+        out = []
+        _write_parts(self.groups, out, r'|')
+        self._s = r''.join(out)
 
     def __iter__(self):
         yield from self.groups
 
-    def __str__(self):
-        return r'|'.join((str(g) for g in self.groups))
-
 
 class Asterik(BaseAdder):
     """Causes the resulting RE to match 0 or more repetitions of the
@@ -250,20 +524,20 @@ class Asterik(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('chars', '_s')
+
     def __init__(self, chars=''):
         if not regex_type_checker(chars, self):
             raise TypeError(
                 f'Expected string or Regex object but received {type(chars)}'
             )
-        self.chars = str(chars)
+        self.chars = _stringify(chars)
+        self._s = rf'{self.chars}*'
 
     @classmethod
     def __call__(cls, chars=''):
         return cls(chars)
 
-    def __str__(self):
-        return rf'{self.chars}*'
-
 
 class BackReference(BaseAdder):
     """A backreference to a named group; it matches whatever text was
@@ -272,19 +546,15 @@ class BackReference(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('ref', '_s')
+
     def __init__(self, ref):
         if not regex_type_checker(ref, self):
             raise TypeError(
                 f'Expected string or Regex object but received {type(ref)}'
             )
-        self.ref = str(ref)
-
-    @classmethod
-    def __call__(cls, ref):
-        return cls(ref)
-
-    def __str__(self):
-        return rf'(?P={self.ref})'
+        self.ref = _stringify(ref)
+        self._s = rf'(?P={self.ref})'
 
 
 class Caret(BaseAdder):
@@ -294,20 +564,20 @@ class Caret(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('chars', '_s')
+
     def __init__(self, chars=''):
         if not regex_type_checker(chars, self):
             raise TypeError(
                 f'Expected string or Regex object but received {type(chars)}'
             )
-        self.chars = str(chars)
+        self.chars = _stringify(chars)
+        self._s = rf'^{self.chars}'
 
     @classmethod
     def __call__(cls, chars=''):
         return cls(chars)
 
-    def __str__(self):
-        return rf'^{self.chars}'
-
 
 class Comment(BaseAdder):
     """A comment; the contents of the parentheses are simply ignored
@@ -315,19 +585,15 @@ class Comment(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('comment', '_s')
+
     def __init__(self, comment):
         if not regex_type_checker(comment, self):
             raise TypeError(
                 f'Expected string or Regex object but received {type(comment)}'
             )
-        self.comment = str(comment)
-
-    @classmethod
-    def __call__(cls, comment):
-        return cls(comment)
-
-    def __str__(self):
-        return rf'(?#{self.comment})'
+        self.comment = _stringify(comment)
+        self._s = rf'(?#{self.comment})'
 
 
 class Dot(BaseAdder):
@@ -338,8 +604,8 @@ class Dot(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __str__(self):
-        return r'.'
+    __slots__ = ()
+    _s = sys.intern(r'.')
 
 
 class End(BaseAdder):
@@ -354,20 +620,20 @@ class End(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('word', '_s')
+
     def __init__(self, word=''):
         if not regex_type_checker(word, self):
             raise TypeError(
                 f'Expected string or Regex object but received {type(word)}'
             )
-        self.word = str(word)
+        self.word = _stringify(word)
+        self._s = rf'{self.word}$'
 
     @classmethod
     def __call__(cls, word=''):
         return cls(word)
 
-    def __str__(self):
-        return fr'{self.word}$'
-
 
 class Escape(BaseAdder):
     """Either escapes special characters (permitting you to match characters
@@ -379,20 +645,20 @@ class Escape(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('char', '_s')
+
     def __init__(self, char=''):
         if not regex_type_checker(char, self):
             raise TypeError(
                 f'Expected string or Regex object but received {type(char)}'
             )
-        self.char = str(char).lstrip(r'\\')
+        self.char = _stringify(char).lstrip(r'\\')
+        self._s = rf'\{self.char}'
 
     @classmethod
     def __call__(cls, char=''):
         return cls(char)
 
-    def __str__(self):
-        return rf'\{self.char}'
-
 
 class Group(BaseAdder):
     """Matches whatever regular expression is inside the parentheses,
@@ -405,19 +671,15 @@ class Group(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('group', '_s')
+
     def __init__(self, group):
         if not regex_type_checker(group, self):
             raise TypeError(
                 f'Expected string or Regex object but received {type(group)}'
             )
-        self.group = str(group)
-
-    @classmethod
-    def __call__(cls, group):
-        return cls(group)
-
-    def __str__(self):
-        return rf'({self.group})'
+        self.group = _stringify(group)
+        self._s = rf'({self.group})'
 
 
 class Groups(BaseAdder):
@@ -431,19 +693,19 @@ class Groups(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __init__(self, groups):
-        self.groups = list(groups)
+    __slots__ = ('groups', '_s')
+    _ITERABLE = True
 
-    @classmethod
-    def __call__(cls, groups):
-        return cls(groups)
+    def __init__(self, groups):
+        self.groups = tuple(groups)
+        out = [r'(']
+        _write_parts(self.groups, out, r'|')
+        out.append(r')')
+        self._s = r''.join(out)
 
     def __iter__(self):
         yield from self.groups
 
-    def __str__(self):
-        return rf"({'|'.join((str(g) for g in self.groups))})"
-
 
 class List(BaseAdder):
     """
@@ -451,19 +713,19 @@ class List(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __init__(self, chars):
-        self.chars = list(chars)
+    __slots__ = ('chars', '_s')
+    _ITERABLE = True
 
-    @classmethod
-    def __call__(cls, chars):
-        return cls(chars)
+    def __init__(self, chars):
+        self.chars = tuple(chars)
+        out = [r'[']
+        _write_parts(self.chars, out)
+        out.append(r']')
+        self._s = r''.join(out)
 
     def __iter__(self):
         yield from self.chars
 
-    def __str__(self):
-        return rf'[{r"".join((str(i) for i in self.chars))}]'
-
 
 class LookAheadAssertion(BaseAdder):
     """Matches if ... matches next, but doesn’t consume any of the string.
@@ -475,20 +737,16 @@ class LookAheadAssertion(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('assertion', '_s')
+
     def __init__(self, assertion):
         if not regex_type_checker(assertion, self):
             raise TypeError(
                 ('Expected string or Regex object '
                 f'but received {type(assertion)}')
             )
-        self.assertion = str(assertion)
-
-    @classmethod
-    def __call__(cls, assertion):
-        return cls(assertion)
-
-    def __str__(self):
-        return rf'(?={self.assertion})'
+        self.assertion = _stringify(assertion)
+        self._s = rf'(?={self.assertion})'
 
 
 class NamedGroup(BaseAdder):
@@ -501,16 +759,12 @@ class NamedGroup(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __init__(self, name, group):
-        self.name = str(name)
-        self.group = str(group)
+    __slots__ = ('name', 'group', '_s')
 
-    @classmethod
-    def __call__(cls, name, group):
-        return cls(name, group)
-
-    def __str__(self):
-        return rf'(?P<{self.name}>{self.group})'
+    def __init__(self, name, group):
+        self.name = _stringify(name)
+        self.group = _stringify(group)
+        self._s = rf'(?P<{self.name}>{self.group})'
 
 
 class NegativeLookAhead(BaseAdder):
@@ -520,15 +774,12 @@ class NegativeLookAhead(BaseAdder):
 
     Documentation Source: https://docs.python.org/3/library/re.html
     """
-    def __init__(self, assertion):
-        self.assertion = str(assertion)
 
-    @classmethod
-    def __call__(cls, assertion):
-        return cls(assertion)
+    __slots__ = ('assertion', '_s')
 
-    def __str__(self):
-        return rf'(?!{self.assertion})'
+    def __init__(self, assertion):
+        self.assertion = _stringify(assertion)
+        self._s = rf'(?!{self.assertion})'
 
 
 class NonMatchingGroup(BaseAdder):
@@ -540,15 +791,11 @@ class NonMatchingGroup(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __init__(self, group):
-        self.group = str(group)
+    __slots__ = ('group', '_s')
 
-    @classmethod
-    def __call__(cls, group):
-        return cls(group)
-
-    def __str__(self):
-        return rf'(?:{self.group})'
+    def __init__(self, group):
+        self.group = _stringify(group)
+        self._s = rf'(?:{self.group})'
 
 
 class NonMatchingGroups(BaseAdder):
@@ -560,25 +807,25 @@ class NonMatchingGroups(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __init__(self, groups):
-        self.groups = list(groups)
+    __slots__ = ('groups', '_s')
+    _ITERABLE = True
 
-    @classmethod
-    def __call__(cls, groups):
-        return cls(groups)
+    def __init__(self, groups):
+        self.groups = tuple(groups)
+        out = [r'(?:']
+        _write_parts(self.groups, out, r'|')
+        out.append(r')')
+        self._s = r''.join(out)
 
     def __iter__(self):
         yield from self.groups
 
-    def __str__(self):
-        return rf"(?:{'|'.join((str(g) for g in self.groups))})"
-
 
 class Period(BaseAdder):
     """An escpaed, r'\.', period"""
 
-    def __str__(self):
-        return r'\.'
+    __slots__ = ()
+    _s = sys.intern(r'\.')
 
 
 class Plus(BaseAdder):
@@ -589,16 +836,16 @@ class Plus(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('chars', '_s')
+
     def __init__(self, chars=''):
-        self.chars = str(chars)
+        self.chars = _stringify(chars)
+        self._s = rf'{self.chars}+'
 
     @classmethod
     def __call__(cls, chars=''):
         return cls(chars)
 
-    def __str__(self):
-        return rf'{self.chars}+'
-
 
 class PositiveLookBehindAssertion(BaseAdder):
     """Matches if the current position in the string is preceded by
@@ -614,23 +861,20 @@ class PositiveLookBehindAssertion(BaseAdder):
 
     Documentation Source: https://docs.python.org/3/library/re.html
     """
-    def __init__(self, assertion, query):
-        self.assertion = str(assertion)
-        self.query = str(query)
 
-    @classmethod
-    def __call__(cls, assertion, query):
-        return cls(assertion, query)
+    __slots__ = ('assertion', 'query', '_s')
 
-    def __str__(self):
-        return rf'(?<={self.assertion}){self.query}'
+    def __init__(self, assertion, query):
+        self.assertion = _stringify(assertion)
+        self.query = _stringify(query)
+        self._s = rf'(?<={self.assertion}){self.query}'
 
 
 class QuestionMark(BaseAdder):
     """An escpaed, r'\?', question mark"""
 
-    def __str__(self):
-        return r'\?'
+    __slots__ = ()
+    _s = sys.intern(r'\?')
 
 
 class StringStartsWith(BaseAdder):
@@ -639,15 +883,11 @@ class StringStartsWith(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
-    def __init__(self, word):
-        self.word = str(word)
-
-    @classmethod
-    def __call__(cls, word):
-        return cls(word)
+    __slots__ = ('word', '_s')
 
-    def __str__(self):
-        return rf'\A{self.word}'
+    def __init__(self, word):
+        self.word = _stringify(word)
+        self._s = rf'\A{self.word}'
 
 
 class ZeroOrOne(BaseAdder):
@@ -657,15 +897,33 @@ class ZeroOrOne(BaseAdder):
     Documentation Source: https://docs.python.org/3/library/re.html
     """
 
+    __slots__ = ('chars', '_s')
+
     def __init__(self, chars=''):
-        self.chars = str(chars)
+        self.chars = _stringify(chars)
+        self._s = rf'{self.chars}?'
 
     @classmethod
     def __call__(cls, chars=''):
         return cls(chars)
 
-    def __str__(self):
-        return rf'{self.chars}?'
+
+def _stringify(value):
+    return value if type(value) is str else str(value)
+
+
+def _write_part(part, out):
+    if isinstance(part, BaseAdder):
+        part._write(out)
+    else:
+        out.append(_stringify(part))
+
+
+def _write_parts(parts, out, sep=None):
+    for i, part in enumerate(parts):
+        if sep is not None and i:
+            out.append(sep)
+        _write_part(part, out)
 
 
 def regex_type_checker(string, _class):
@@ -673,8 +931,377 @@ def regex_type_checker(string, _class):
         return False
     return True
 
+
+def _scoped(regex):
+    # Applies a Regex's own flags to just its part of a larger pattern
+    letters = ''.join(
+        letter
+        for flag, letter in (
+            (re.ASCII, 'a'),
+            (re.IGNORECASE, 'i'),
+            (re.MULTILINE, 'm'),
+            (re.DOTALL, 's'),
+            (re.VERBOSE, 'x'),
+        )
+        if regex.flags & flag
+    )
+    return rf'(?{letters}:{regex})' if letters else str(regex)
+
+
+def _combinable(regex, part):
+    # Returns part, regex wrapped for MultiRegex.combined, or None when
+    # the wrapping would break or change the meaning of regex
+    parsed = sre_parse.parse(str(regex), regex.flags)
+    if _has_group_refs(parsed):
+        # Group numbers shift by one inside the wrapping group
+        return None
+    if parsed.state.flags != sre_parse.parse('', regex.flags).state.flags:
+        # Global inline flags, e.g. (?i), would apply to every regex
+        return None
+    try:
+        _compile(part, 0)
+    except re.error:
+        return None
+    return part
+
+
+def _has_group_refs(subpattern):
+    for op, av in subpattern.data:
+        if op is sre_constants.GROUPREF or op is sre_constants.GROUPREF_EXISTS:
+            return True
+        if any(map(_has_group_refs, _subpatterns(av))):
+            return True
+    return False
+
+
+def _subpatterns(av):
+    if isinstance(av, sre_parse.SubPattern):
+        yield av
+    elif isinstance(av, (tuple, list)):
+        for item in av:
+            yield from _subpatterns(item)
+
+
+def _class_escapes(pattern):
+    # Whether pattern uses \w, \d, \s, \b or their negations, whose
+    # Unicode meaning in re no prefilter engine reproduces exactly
+    escaped = False
+    for char in pattern:
+        if escaped and char in 'wWdDsSbB':
+            return True
+        escaped = not escaped and char == '\\'
+    return False
+
+
+def _prefilter_safe(pattern, flags):
+    # Whether Hyperscan and RE2 read pattern as re does, or as a superset
+    # of it, so a prefilter built from it never hides a match re finds
+    if not flags & re.ASCII and _class_escapes(pattern):
+        return False
+    if '{,' in pattern or '[:' in pattern:
+        # re reads {,n} and {,} as repeats, RE2 and Hyperscan as literal
+        # text, and [[:alpha:]] is a POSIX class to them but not to re
+        return False
+    parsed = sre_parse.parse(pattern, flags)
+    ignorecase = parsed.state.flags & re.IGNORECASE
+    return not _casefold_differs(
+        parsed, ignorecase and not parsed.state.flags & re.ASCII
+    )
+
+
+def _casefold_differs(subpattern, ignorecase):
+    # Whether a case-insensitive part of subpattern matches i or I, which
+    # re also matches against the dotted and dotless I, or anything
+    # outside ASCII, whose case folding the prefilters may not share
+    for op, av in subpattern.data:
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, body = av
+            nested = (ignorecase or add_flags & re.IGNORECASE) and not (
+                del_flags & re.IGNORECASE
+            )
+            if _casefold_differs(body, nested):
+                return True
+            continue
+        if ignorecase and op is sre_constants.LITERAL:
+            if _folds_apart(av, av):
+                return True
+        elif ignorecase and op is sre_constants.IN:
+            if _set_folds_apart(av):
+                return True
+        if any(_casefold_differs(p, ignorecase) for p in _subpatterns(av)):
+            return True
+    return False
+
+
+def _set_folds_apart(items):
+    # A negated set can only match more in the prefilters, never less
+    if (sre_constants.NEGATE, None) in items:
+        return False
+    for op, av in items:
+        if op is sre_constants.LITERAL and _folds_apart(av, av):
+            return True
+        if op is sre_constants.RANGE and _folds_apart(*av):
+            return True
+    return False
+
+
+def _folds_apart(low, high):
+    return high > 0x7F or low <= ord('i') <= high or low <= ord('I') <= high
+
+
+def _hyperscan_flags(flags):
+    # Returns None when flags has bits Hyperscan cannot express
+    hs_flags = (
+        hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_ALLOWEMPTY
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    for flag, hs_flag in (
+        (re.IGNORECASE, hyperscan.HS_FLAG_CASELESS),
+        (re.MULTILINE, hyperscan.HS_FLAG_MULTILINE),
+        (re.DOTALL, hyperscan.HS_FLAG_DOTALL),
+        (re.UNICODE, 0),
+    ):
+        if flags & flag:
+            hs_flags |= hs_flag
+            flags &= ~flag
+    if flags & re.ASCII:
+        # Without UCP, Hyperscan's classes are ASCII-only like re's
+        hs_flags &= ~hyperscan.HS_FLAG_UCP
+        flags &= ~re.ASCII
+    return None if flags else hs_flags
+
+
+def _hyperscan_prefilter(regexes):
+    expressions, ids, flags, fallback = [], [], [], set()
+    for i, regex in enumerate(regexes):
+        pattern = str(regex)
+        hs_flags = _hyperscan_flags(regex.flags)
+        if not _prefilter_safe(pattern, regex.flags):
+            hs_flags = None
+        if hs_flags is not None:
+            try:
+                expression = pattern.encode('utf8')
+                hyperscan.Database().compile(
+                    expressions=[expression],
+                    ids=[i],
+                    elements=1,
+                    flags=[hs_flags],
+                )
+            except (UnicodeEncodeError, hyperscan.error):
+                hs_flags = None
+        if hs_flags is None:
+            fallback.add(i)
+            continue
+        expressions.append(expression)
+        ids.append(i)
+        flags.append(hs_flags)
+    if not expressions:
+        return None, frozenset(fallback)
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions, ids=ids, elements=len(ids), flags=flags
+    )
+
+    def prefilter(string):
+        found = set()
+        try:
+            data = string.encode('utf8') if type(string) is str else string
+        except UnicodeEncodeError:
+            # Lone surrogates have no UTF-8 form, so run every regex
+            return set(ids)
+        database.scan(
+            data, match_event_handler=_hyperscan_on_match, context=found
+        )
+        return found
+
+    return prefilter, frozenset(fallback)
+
+
+def _hyperscan_on_match(id, start, end, flags, context):
+    context.add(id)
+
+
+def _re2_prefix(pattern, flags):
+    # RE2's ^ and $ ignore a trailing newline, which could hide a match
+    # re would find. Returns the inline flags that make RE2 match a
+    # superset of re, or None
+    if not _prefilter_safe(pattern, flags):
+        return None
+    flags &= ~(re.ASCII | re.UNICODE)
+    prefix = 'm'
+    for flag, letter in ((re.IGNORECASE, 'i'), (re.DOTALL, 's')):
+        if flags & flag:
+            prefix += letter
+            flags &= ~flag
+    return None if flags else rf'(?{prefix})'
+
+
+def _re2_prefilter(regexes):
+    options = re2.Options()
+    options.log_errors = False
+    options.never_capture = True
+    regex_set = re2.Set.SearchSet(options)
+    ids, fallback = [], set()
+    for i, regex in enumerate(regexes):
+        pattern = str(regex)
+        prefix = _re2_prefix(pattern, regex.flags)
+        if prefix is not None:
+            try:
+                regex_set.Add(prefix + pattern)
+            except (UnicodeEncodeError, re2.error):
+                prefix = None
+        if prefix is None:
+            fallback.add(i)
+            continue
+        ids.append(i)
+    if not ids:
+        return None, frozenset(fallback)
+    regex_set.Compile()
+
+    def prefilter(string):
+        try:
+            matched = regex_set.Match(string)
+        except UnicodeEncodeError:
+            # Lone surrogates have no UTF-8 form, so run every regex
+            return set(ids)
+        return {ids[j] for j in matched or ()}
+
+    return prefilter, frozenset(fallback)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile(pattern, flags):
+    # Shared by every Regex so equal patterns built separately compile
+    # once, independent of the size of re's own internal cache
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=4096)
+def _required_literal(pattern, flags):
+    # The longest run of plain characters that every match of pattern
+    # contains, so strings without it can be rejected with a substring
+    # check before running the regex engine. '' when there is none
+    if flags & re.IGNORECASE:
+        return ''
+    parsed = sre_parse.parse(pattern, flags)
+    if parsed.state.flags & re.IGNORECASE:
+        return ''
+    return max(_literal_runs(parsed), key=len, default='')
+
+
+def _literal_runs(subpattern, runs=None):
+    runs = [] if runs is None else runs
+    run = []
+    for op, av in subpattern.data:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            runs.append(''.join(run))
+            run = []
+        # Only descend into parts that must match at least once; anything
+        # inside an alternation or an optional repeat is not required
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, _, body = av
+            if not add_flags & re.IGNORECASE:
+                _literal_runs(body, runs)
+        elif op in (
+            sre_constants.MAX_REPEAT,
+            sre_constants.MIN_REPEAT,
+            getattr(sre_constants, 'POSSESSIVE_REPEAT', None),
+        ):
+            if av[0] >= 1:
+                _literal_runs(av[2], runs)
+        elif op is getattr(sre_constants, 'ATOMIC_GROUP', None):
+            _literal_runs(av, runs)
+    if run:
+        runs.append(''.join(run))
+    return runs
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_width(pattern, flags):
+    # (min, max) length of any match; max is None when it is unbounded or
+    # when a lookahead could read past the end of the match
+    min_width, max_width = sre_parse.parse(pattern, flags).getwidth()
+    if (
+        max_width >= sre_constants.MAXREPEAT
+        or '(?=' in pattern
+        or '(?!' in pattern
+    ):
+        max_width = None
+    return min_width, max_width
+
+
+def _finditer_parallel(pattern, string, workers, chunk):
+    # Every worker matches against the full string, so anchors and
+    # lookarounds behave exactly as in finditer, and the zone boundaries
+    # are reconciled in order while merging
+    length = len(string)
+    min_width, max_width = _match_width(pattern.pattern, pattern.flags)
+    if min_width == 0:
+        # An empty match changes where finditer resumes, which a zone
+        # cannot know, so these are scanned sequentially
+        yield from pattern.finditer(string)
+        return
+
+    def endpos(stop):
+        # No match starting before stop can read past stop + max_width,
+        # plus one character either side for $ and \b
+        if max_width is None:
+            return length
+        return min(length, stop + max_width + 2)
+
+    zones = [(i, min(i + chunk, length)) for i in range(0, length, chunk)]
+    resume = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _finditer_zone, pattern, string, start, stop, endpos(stop)
+            )
+            for start, stop in zones
+        ]
+        for (start, stop), future in zip(zones, futures):
+            matches = future.result()
+            # Nothing starts between the last match and the previous
+            # zone's end, so the sequential scan may as well resume here
+            resume = max(resume, start)
+            k = 0
+            while k < len(matches) and matches[k].start() < resume:
+                k += 1
+            if (matches[k - 1].end() if k else start) > resume:
+                # The worker is midway through a match that straddles
+                # the resume point, so redo this zone sequentially
+                matches, k = [], 0
+                for match in pattern.finditer(string, resume, endpos(stop)):
+                    if match.start() >= stop:
+                        break
+                    matches.append(match)
+            for match in matches[k:]:
+                resume = match.end()
+                yield match
+
+
+def _finditer_zone(pattern, string, start, stop, endpos):
+    matches = []
+    for match in pattern.finditer(string, start, endpos):
+        if match.start() >= stop:
+            break
+        matches.append(match)
+    return matches
+
+
 def compile(regex, flags=0):
-    return Regex(regex, flags=flags)
+    """Returns regex as a Regex whose pattern is compiled up front, so
+    a bad pattern raises here as it would with re.compile"""
+    if isinstance(regex, Regex):
+        regex = Regex(*regex.parts, flags=flags)
+    else:
+        regex = Regex(regex, flags=flags)
+    regex.compiled
+    return regex
 
 
 ALL_OR_NONE = Asterik()
@@ -714,41 +1341,42 @@ ZERO_OR_ONE = ZeroOrOne()
 
 
 __all__ = (
-    compile,
-    ALL_OR_NONE,
-    ANY,
-    ANYTHING,
-    ANY_DIGIT,
-    ANY_DIGITS,
-    ANY_NON_DIGIT,
-    ANY_NON_DIGITS,
-    ANY_NON_WORD,
-    ANY_NON_WORDS,
-    ANY_WORD,
-    ANY_WORDS,
-    ANY_WORD_GROUPS,
-    BACK_REFERENCE,
-    COMMENT,
-    ESCAPE,
-    LINE_END,
-    LINE_START,
-    LIST,
-    LOOK_AHEAD,
-    NAMED_GROUP,
-    NEGATIVE_LOOK_AHEAD,
-    NON_WHITESPACE,
-    NON_MATCHING_GROUP,
-    NON_MATCHING_GROUPS,
-    ONE_OR_MORE,
-    PERIOD,
-    POSITIVE_LOOK_BEHIND,
-    STRING_STARTS_WITH,
-    QUESTION_MARK,
-    WHITESPACE,
-    WHITESPACES,
-    WORD_GROUP,
-    WORD_GROUPS,
-    ZERO_OR_ONE,
+    'compile',
+    'MultiRegex',
+    'ALL_OR_NONE',
+    'ANY',
+    'ANYTHING',
+    'ANY_DIGIT',
+    'ANY_DIGITS',
+    'ANY_NON_DIGIT',
+    'ANY_NON_DIGITS',
+    'ANY_NON_WORD',
+    'ANY_NON_WORDS',
+    'ANY_WORD',
+    'ANY_WORDS',
+    'ANY_WORD_GROUPS',
+    'BACK_REFERENCE',
+    'COMMENT',
+    'ESCAPE',
+    'LINE_END',
+    'LINE_START',
+    'LIST',
+    'LOOK_AHEAD',
+    'NAMED_GROUP',
+    'NEGATIVE_LOOK_AHEAD',
+    'NON_WHITESPACE',
+    'NON_MATCHING_GROUP',
+    'NON_MATCHING_GROUPS',
+    'ONE_OR_MORE',
+    'PERIOD',
+    'POSITIVE_LOOK_BEHIND',
+    'STRING_STARTS_WITH',
+    'QUESTION_MARK',
+    'WHITESPACE',
+    'WHITESPACES',
+    'WORD_GROUP',
+    'WORD_GROUPS',
+    'ZERO_OR_ONE',
 )
 
 
@@ -0,0 +1,73 @@
+import random
+import re
+import sys
+import unittest
+from unittest import mock
+
+from REVerbose import main
+from REVerbose.main import Regex, _finditer_parallel
+
+
+def _text():
+    rng = random.Random(0)
+    words = ['ab', 'abab', 'ba', 'aab', 'b', 'a' * 30, 'ab ab', '\n']
+    return ' '.join(rng.choice(words) for _ in range(3000))
+
+
+class FinditerParallelTest(unittest.TestCase):
+
+    patterns = (
+        # Matches that straddle zone boundaries
+        (r'a+b', 0),
+        (r'ab ab', 0),
+        (r'(?:ab)+', 0),
+        (r'a{10,40}', 0),
+        (r'[ab ]{5,}', 0),
+        (r'.+', 0),
+        (r'(?s).+', 0),
+        # Anchors and word boundaries next to a boundary
+        (r'b$', re.M),
+        (r'^a', re.M),
+        (r'\bab\b', 0),
+        (r'\Bb', 0),
+        (r'b\Z', 0),
+        # Lookarounds reading across a boundary
+        (r'ab(?= )', 0),
+        (r'ab(?=[^\n]*\n)', 0),
+        (r'a(?!a)', 0),
+        (r'(?<=a)b', 0),
+        # Back references and empty matches
+        (r'(ab) \1', 0),
+        (r'a*', 0),
+        (r'\b', 0),
+    )
+
+    def test_same_matches_as_finditer(self):
+        text = _text()
+        for pattern, flags in self.patterns:
+            compiled = re.compile(pattern, flags)
+            expected = [m.span() for m in compiled.finditer(text)]
+            for chunk in (7, 64, 1000, len(text)):
+                with self.subTest(pattern=pattern, chunk=chunk):
+                    found = _finditer_parallel(compiled, text, 4, chunk)
+                    self.assertEqual([m.span() for m in found], expected)
+
+    def test_method_without_gil(self):
+        text = _text() * 4
+        self.assertGreater(len(text), 16 * 1024)
+        regex = Regex('a+b')
+        with mock.patch.object(
+            sys, '_is_gil_enabled', lambda: False, create=True
+        ), mock.patch.object(
+            main, '_finditer_parallel', wraps=_finditer_parallel
+        ) as parallel:
+            found = regex.finditer_parallel(text, chunk=1000)
+            self.assertEqual(
+                [m.span() for m in found],
+                [m.span() for m in regex.finditer(text)],
+            )
+        parallel.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import re
+import unittest
+from unittest import mock
+
+from REVerbose import main
+from REVerbose.main import MultiRegex, Regex
+
+
+def _prefilters(regexes):
+    # Yields a MultiRegex built with each prefilter installed here, and
+    # with none
+    with mock.patch.multiple(main, hyperscan=None, re2=None):
+        yield 're', MultiRegex(regexes)
+    if main.re2 is not None:
+        with mock.patch.object(main, 'hyperscan', None):
+            yield 're2', MultiRegex(regexes)
+    if main.hyperscan is not None:
+        yield 'hyperscan', MultiRegex(regexes)
+
+
+class SearchTest(unittest.TestCase):
+    # No prefilter may hide a match re finds
+
+    cases = (
+        (r'\s', 0, ['\x1c', '\x1f', '\x85', '\u3000']),
+        ('a{,3}b', 0, ['aab', 'b']),
+        ('x{,}y', 0, ['xxy']),
+        ('[[:alpha:]]', 0, [':]', 'a]']),
+        ('(?i)i', 0, ['\u0130', '\u0131']),
+        ('i', re.I, ['\u0130', '\u0131']),
+        ('[h-j]', re.I, ['\u0130']),
+        ('(?i:ki)ng', 0, ['K\u0130ng']),
+        ('stra\u00dfe', re.I, ['STRASSE', 'stra\u1e9ee']),
+        ('a', 0, ['a\ud800']),
+        (r'\w+\b', re.A, ['abc', 'ab\u00e9']),
+        (r'\s', re.A, [' ', '\x1c']),
+        ('k', re.A | re.I, ['K', '\u212a']),
+    )
+
+    def test_matches_re(self):
+        for pattern, flags, strings in self.cases:
+            regex = Regex(pattern, flags=flags)
+            for name, multi in _prefilters([Regex('q'), regex]):
+                for string in strings:
+                    with self.subTest(
+                        prefilter=name, pattern=pattern, string=string
+                    ):
+                        expected = re.search(pattern, string, flags)
+                        found = multi.search(string).get(1)
+                        self.assertEqual(
+                            found and found.span(),
+                            expected and expected.span(),
+                        )
+
+
+class FlagsTest(unittest.TestCase):
+    # Regex equality ignores flags, so results are keyed by position
+
+    regexes = (Regex('a'), Regex('a', flags=re.I))
+
+    def test_search(self):
+        for name, multi in _prefilters(self.regexes):
+            with self.subTest(prefilter=name):
+                self.assertEqual(list(multi.search('A')), [1])
+                self.assertEqual(sorted(multi.search('a')), [0, 1])
+
+    def test_counts(self):
+        multi = MultiRegex(self.regexes)
+        self.assertEqual(multi.counts(['aA']), {0: 1, 1: 1})
+
+
+class CountsTest(unittest.TestCase):
+
+    def test_combined_counts(self):
+        multi = MultiRegex([Regex('a'), Regex('b')])
+        self.assertEqual(multi.counts(['aab', 'b']), {0: 2, 1: 2})
+
+    def test_numbered_back_reference(self):
+        multi = MultiRegex([Regex('b'), Regex(r'(a)\1')])
+        self.assertEqual(multi.counts(['aa', 'ab']), {0: 1, 1: 1})
+        self.assertEqual(multi.combined.pattern, '(?P<_r0>b)')
+
+    def test_group_exists_reference(self):
+        multi = MultiRegex([Regex('z'), Regex(r'(a)?(?(1)b|c)')])
+        self.assertEqual(multi.counts(['ab c']), {1: 2})
+
+    def test_duplicate_group_names(self):
+        multi = MultiRegex([Regex('(?P<x>a)'), Regex('(?P<x>b)')])
+        self.assertEqual(multi.counts(['ab']), {0: 1, 1: 1})
+
+    def test_group_name_used_by_combined(self):
+        multi = MultiRegex([Regex('a'), Regex('(?P<_r0>b)')])
+        self.assertEqual(multi.counts(['ab']), {0: 1, 1: 1})
+
+    def test_global_inline_flags(self):
+        multi = MultiRegex([Regex('(?i)a'), Regex('b')])
+        self.assertEqual(multi.counts(['AaB', 'b']), {0: 2, 1: 1})
+
+    def test_nothing_combinable(self):
+        multi = MultiRegex([Regex(r'(a)\1')])
+        self.assertIsNone(multi.combined)
+        self.assertEqual(multi.counts(['aaaa']), {0: 2})
+
+    def test_empty(self):
+        self.assertEqual(MultiRegex([]).counts(['a']), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
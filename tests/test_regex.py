@@ -0,0 +1,66 @@
+import re
+import unittest
+
+from REVerbose.main import ANY_DIGIT, ANY_WORD, WORD_GROUP, Regex
+
+
+class CacheTest(unittest.TestCase):
+    # Every cached rendering must be rebuilt once += changes the parts
+
+    def warm(self, regex):
+        regex.search('macbeth')
+        hash(regex)
+        repr(regex)
+        list(regex)
+        return regex.parts
+
+    def test_iadd_rebuilds_caches(self):
+        mac, beth = WORD_GROUP('mac'), WORD_GROUP('beth')
+        regex = Regex(mac)
+        parts = self.warm(regex)
+        regex += beth
+        expected = Regex(mac, beth)
+        self.assertEqual(str(regex), '(mac)(beth)')
+        self.assertEqual(''.join(regex), '(mac)(beth)')
+        self.assertEqual(hash(regex), hash(expected))
+        self.assertEqual(repr(regex), repr(expected))
+        self.assertEqual(regex.parts, (mac, beth))
+        self.assertEqual(regex.compiled.pattern, '(mac)(beth)')
+        self.assertIsNone(regex.search('mac'))
+        self.assertEqual(regex.search('macbeth').group(), 'macbeth')
+        self.assertEqual(parts, (mac,))
+
+    def test_iadd_regex(self):
+        regex = Regex(ANY_WORD)
+        self.warm(regex)
+        regex += Regex(ANY_DIGIT, ANY_DIGIT)
+        self.assertEqual(str(regex), r'\w\d\d')
+        self.assertEqual(len(regex.parts), 3)
+        regex += regex
+        self.assertEqual(str(regex), r'\w\d\d\w\d\d')
+        self.assertEqual(regex.search('a12b34').span(), (0, 6))
+
+    def test_add_leaves_operands(self):
+        regex = Regex(ANY_WORD)
+        self.warm(regex)
+        combined = regex + ANY_DIGIT
+        self.assertEqual(str(regex), r'\w')
+        self.assertEqual(str(combined), r'\w\d')
+
+    def test_flags_setter_recompiles(self):
+        regex = Regex(WORD_GROUP('mac'))
+        self.assertIsNone(regex.search('MAC'))
+        regex.flags = re.I
+        self.assertEqual(regex.compiled.flags & re.I, re.I)
+        self.assertEqual(regex.search('MAC').group(), 'MAC')
+
+    def test_sticky_flags(self):
+        regex = Regex(WORD_GROUP('mac'))
+        self.assertEqual(regex.search('MAC', re.I).group(), 'MAC')
+        self.assertEqual(regex.search('MAC').group(), 'MAC')
+        self.assertIsNone(regex.search('MAC', 0))
+        self.assertIsNone(regex.search('MAC'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import re
+import unittest
+
+from REVerbose.main import Regex
+
+
+class RequiredLiteralTest(unittest.TestCase):
+    # Strings without the required literal are rejected before re runs,
+    # so every search must still agree with re on strings with and
+    # without it
+
+    cases = (
+        # Inline and scoped flags
+        ('(?i)macbeth', 0, ['MACBETH', 'Macbeth', 'macduff']),
+        ('(?i:mac)beth', 0, ['MACbeth', 'MACBETH', 'beth']),
+        ('mac(?i:BETH)', 0, ['macbeth', 'MACbeth', 'mac']),
+        ('macbeth', re.I, ['MacBeth', 'banquo']),
+        ('(?x) mac  beth', 0, ['macbeth', 'mac beth']),
+        ('(?s)mac.beth', 0, ['mac\nbeth', 'macbeth']),
+        # Branches
+        ('macbeth|banquo', 0, ['banquo', 'macbeth', 'duncan']),
+        ('the (king|queen)', 0, ['the queen', 'the king', 'the thane']),
+        ('(?:ab|cd)ef', 0, ['cdef', 'abef', 'ef']),
+        # Optional and required repeats
+        ('colou?r', 0, ['color', 'colour', 'colr']),
+        ('(?:mac)?beth', 0, ['beth', 'macbeth', 'mac']),
+        ('(?:mac)*beth', 0, ['beth', 'macmacbeth']),
+        ('(?:mac)+beth', 0, ['macbeth', 'beth']),
+        ('(?:mac){2}beth', 0, ['macmacbeth', 'macbeth']),
+        ('(?:mac){0,2}beth', 0, ['beth', 'macbeth']),
+        ('(?:mac)+?beth', 0, ['macbeth', 'beth']),
+        ('(?>mac)beth', 0, ['macbeth', 'beth']),
+        # Lookarounds
+        ('mac(?=beth)', 0, ['macbeth', 'macduff']),
+        ('mac(?!beth)', 0, ['macduff', 'macbeth']),
+        ('(?<=lady )macbeth', 0, ['lady macbeth', 'macbeth']),
+        ('(?<!lady )macbeth', 0, ['macbeth', 'lady macbeth']),
+        # Anchors, escapes and groups
+        (r'\Amacbeth', 0, ['macbeth', ' macbeth']),
+        (r'^mac$', re.M, ['a\nmac\nb', 'mac ']),
+        (r'mac\.beth', 0, ['mac.beth', 'macbeth']),
+        (r'(?P<name>mac)beth(?P=name)', 0, ['macbethmac', 'macbeth']),
+        (r'\w+ and \w+', 0, ['fair and foul', 'fairandfoul']),
+        ('[mM]acbeth', 0, ['Macbeth', 'macbeth', 'acbeth']),
+    )
+
+    def test_search(self):
+        for pattern, flags, strings in self.cases:
+            regex = Regex(pattern, flags=flags)
+            for string in strings:
+                with self.subTest(pattern=pattern, string=string):
+                    expected = re.search(pattern, string, flags)
+                    found = regex.search(string)
+                    self.assertEqual(
+                        found and found.span(), expected and expected.span()
+                    )
+
+    def test_match_and_fullmatch(self):
+        for pattern, flags, strings in self.cases:
+            regex = Regex(pattern, flags=flags)
+            for string in strings:
+                with self.subTest(pattern=pattern, string=string):
+                    self.assertEqual(
+                        bool(regex.match(string)),
+                        bool(re.match(pattern, string, flags)),
+                    )
+                    self.assertEqual(
+                        bool(regex.fullmatch(string)),
+                        bool(re.fullmatch(pattern, string, flags)),
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
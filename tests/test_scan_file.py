@@ -0,0 +1,40 @@
+import os
+import re
+import tempfile
+import unittest
+
+from REVerbose.main import Regex
+
+
+class ScanFileTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write('Personæ\nab ab\n\nab\n'.encode())
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_matches(self):
+        found = [m.group() for m in Regex('ab').scan_file(self.path)]
+        self.assertEqual(found, [b'ab', b'ab', b'ab'])
+
+    def test_lines(self):
+        found = [
+            (line, m.group()) for line, m in
+            Regex('ab').scan_file(self.path, lines=True)
+        ]
+        self.assertEqual(found, [(2, b'ab'), (2, b'ab'), (4, b'ab')])
+
+    def test_unicode_flag(self):
+        regex = Regex(r'\w+', flags=re.UNICODE)
+        self.assertEqual(next(regex.scan_file(self.path)).group(), b'Person')
+
+    def test_empty_file(self):
+        open(self.path, 'wb').close()
+        self.assertEqual(list(Regex('ab').scan_file(self.path)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()